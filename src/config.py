@@ -2,13 +2,42 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import pickle
+import re
+import tempfile
+from collections import OrderedDict
+from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    # The libyaml-backed loader is several times faster than the pure-Python one.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Parsed YAML documents keyed by (abspath, mtime_ns, size) so repeated loads of
+# an unchanged file skip disk I/O and parsing. Bounded to keep memory flat.
+_YAML_CACHE: OrderedDict[Tuple[str, int, int], Dict[str, Any]] = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+# Persistent cache of parsed YAML documents, so fresh CLI invocations can skip
+# parsing too. Bump _DISK_CACHE_VERSION whenever the cached format changes.
+_DISK_CACHE_VERSION = 1
+_DISK_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "phishing-awareness",
+)
+
+# load_dotenv() scans the filesystem, so only run it once per process.
+_DOTENV_LOADED = False
+
 
 @dataclass
 class CampaignConfig:
@@ -48,34 +77,159 @@ class ConfigError(ValueError):
     """Raised when configuration is missing or invalid."""
 
 
+# Matches ${ENV_VAR} placeholders anywhere inside a string value.
+_ENV_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+# Declarative field schemas: (key, coercion, default). Fields defaulting to
+# _REQUIRED must be present; a coercion of None passes the value through.
+_REQUIRED = object()
+_Schema = Tuple[Tuple[str, Optional[Callable[[Any], Any]], Any], ...]
+
+_APP_SCHEMA: _Schema = (
+    ("allow_live_send", bool, False),
+    ("dry_run", bool, True),
+    ("base_url", str, ""),
+    ("api_key", str, ""),
+    ("verify_tls", bool, True),
+)
+
+_CAMPAIGN_SCHEMA: _Schema = (
+    ("name", str, _REQUIRED),
+    ("group_name", str, _REQUIRED),
+    ("template_name", str, _REQUIRED),
+    ("page_name", str, _REQUIRED),
+    ("sending_profile_name", str, _REQUIRED),
+    ("url", str, _REQUIRED),
+    ("launch_date", None, None),
+)
+
+_REPORTING_SCHEMA: _Schema = (
+    ("unique_clicks_only", bool, True),
+    ("unique_opens_only", bool, True),
+)
+
+
+def _convert(raw: Dict[str, Any], schema: _Schema, prefix: str) -> Dict[str, Any]:
+    """Coerce a raw config section into keyword arguments for a dataclass."""
+
+    values = {}
+    for key, coerce, default in schema:
+        if key in raw:
+            value = raw[key]
+            values[key] = coerce(value) if coerce is not None else value
+        elif default is _REQUIRED:
+            raise ConfigError(f"{prefix}{key} is required")
+        else:
+            values[key] = default
+    return values
+
+
+def _substitute_env(match: re.Match[str]) -> str:
+    """Return the environment value for a placeholder, or the placeholder itself."""
+
+    return os.environ.get(match.group(1), match.group(0))
+
+
 def _resolve_env(value: Any) -> Any:
     """Resolve ${ENV_VAR} placeholders in string values.
 
     This allows config files to reference secrets stored in environment variables.
-    If the placeholder is not set, the original value is returned so validation
-    can surface a clear error later.
+    Placeholders may appear anywhere in a string (e.g. inside a URL) and in
+    nested sections. If a placeholder is not set, it is left as-is so
+    validation can surface a clear error later.
     """
 
-    if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-        env_key = value[2:-1]
-        return os.environ.get(env_key, value)
+    if isinstance(value, str):
+        return _ENV_RE.sub(_substitute_env, value) if "${" in value else value
+    if isinstance(value, dict):
+        return {key: _resolve_env(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_env(item) for item in value]
     return value
 
 
-def _load_yaml(path: str) -> Dict[str, Any]:
-    """Load a YAML file into a dictionary."""
+def _disk_cache_path(abspath: str) -> str:
+    """Return the cache file used for a given config path."""
+
+    digest = hashlib.sha256(abspath.encode("utf-8")).hexdigest()
+    return os.path.join(_DISK_CACHE_DIR, f"{digest}.pkl")
+
 
-    with open(path, "r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
-    # Resolve any ${ENV_VAR} placeholders in the top-level keys.
-    return {key: _resolve_env(value) for key, value in raw.items()}
+def _read_disk_cache(abspath: str, stamp: Tuple[int, int, int]) -> Optional[Dict[str, Any]]:
+    """Return the cached document if it matches the current file stamp."""
 
+    try:
+        with open(_disk_cache_path(abspath), "rb") as handle:
+            cached_stamp, raw = pickle.load(handle)
+    except Exception:
+        # A missing or unreadable cache must never block loading the config.
+        return None
+    return raw if cached_stamp == stamp else None
 
-def load_config(path: str) -> AppConfig:
-    """Parse the YAML config file and return a structured AppConfig."""
 
-    load_dotenv()
-    raw = _load_yaml(path)
+def _write_disk_cache(abspath: str, stamp: Tuple[int, int, int], raw: Dict[str, Any]) -> None:
+    """Store a parsed document, ignoring failures (e.g. read-only home)."""
+
+    try:
+        os.makedirs(_DISK_CACHE_DIR, mode=0o700, exist_ok=True)
+        # Write to a private temp file and rename so readers never see a
+        # partial pickle.
+        fd, tmp_path = tempfile.mkstemp(dir=_DISK_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump((stamp, raw), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, _disk_cache_path(abspath))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _load_yaml(path: str, use_disk_cache: bool = True) -> Dict[str, Any]:
+    """Load a YAML file into a dictionary.
+
+    Parsed documents are cached in memory and, unless disabled, on disk, keyed
+    by path, modification time and size. The cache stores the document before
+    placeholder resolution so secrets from the environment are never written
+    to disk and environment changes are still picked up. Memory hits return a
+    deep copy so callers can mutate the result.
+    """
+
+    stat = os.stat(path)
+    abspath = os.path.abspath(path)
+    key = (abspath, stat.st_mtime_ns, stat.st_size)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None:
+        _YAML_CACHE.move_to_end(key)
+        raw = deepcopy(cached)
+    else:
+        stamp = (_DISK_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+        raw = _read_disk_cache(abspath, stamp) if use_disk_cache else None
+        if raw is None:
+            with open(path, "r", encoding="utf-8") as handle:
+                raw = yaml.load(handle, Loader=_YamlLoader) or {}
+            if use_disk_cache:
+                _write_disk_cache(abspath, stamp, raw)
+        _YAML_CACHE[key] = deepcopy(raw)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+
+    # Resolve any ${ENV_VAR} placeholders throughout the document.
+    return _resolve_env(raw)
+
+
+def load_config(path: str, use_cache: bool = True) -> AppConfig:
+    """Parse the YAML config file and return a structured AppConfig.
+
+    Set use_cache to False to bypass the on-disk parse cache.
+    """
+
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+    raw = _load_yaml(path, use_disk_cache=use_cache)
 
     try:
         campaign_raw = raw["campaign"]
@@ -83,29 +237,10 @@ def load_config(path: str) -> AppConfig:
     except KeyError as exc:
         raise ConfigError("Missing required config sections") from exc
 
-    campaign = CampaignConfig(
-        name=str(campaign_raw["name"]),
-        group_name=str(campaign_raw["group_name"]),
-        template_name=str(campaign_raw["template_name"]),
-        page_name=str(campaign_raw["page_name"]),
-        sending_profile_name=str(campaign_raw["sending_profile_name"]),
-        url=str(campaign_raw["url"]),
-        launch_date=campaign_raw.get("launch_date"),
-    )
-
-    reporting = ReportingConfig(
-        unique_clicks_only=bool(reporting_raw.get("unique_clicks_only", True)),
-        unique_opens_only=bool(reporting_raw.get("unique_opens_only", True)),
-    )
-
     config = AppConfig(
-        allow_live_send=bool(raw.get("allow_live_send", False)),
-        dry_run=bool(raw.get("dry_run", True)),
-        base_url=str(raw.get("base_url", "")),
-        api_key=str(raw.get("api_key", "")),
-        verify_tls=bool(raw.get("verify_tls", True)),
-        campaign=campaign,
-        reporting=reporting,
+        **_convert(raw, _APP_SCHEMA, ""),
+        campaign=CampaignConfig(**_convert(campaign_raw, _CAMPAIGN_SCHEMA, "campaign.")),
+        reporting=ReportingConfig(**_convert(reporting_raw, _REPORTING_SCHEMA, "reporting.")),
     )
 
     _validate_config(config)
@@ -3,9 +3,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+try:
+    # Optional: ijson parses campaign results incrementally for large campaigns.
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: orjson decodes large campaign payloads several times faster.
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class GophishError(RuntimeError):
@@ -34,22 +49,59 @@ class GophishClient:
         self.api_key = api_key
         self.timeout = timeout
         self.verify_tls = verify_tls
-
-    def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Any:
-        """Send an HTTP request to the Gophish API and return JSON data."""
+        # Campaign responses keyed by request path, with their validators.
+        self._campaign_cache: Dict[str, Tuple[Optional[str], Optional[str], Any]] = {}
+
+        # A persistent session keeps connections alive between calls, so the
+        # polling loop and concurrent lookups skip repeated TCP/TLS handshakes.
+        # Only idempotent requests are retried on gateway errors.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(
+            {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+        )
+
+    def close(self) -> None:
+        """Release pooled connections held by the client."""
+
+        self._session.close()
+
+    def __enter__(self) -> "GophishClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send an HTTP request to the Gophish API and return the raw response."""
 
         url = f"{self.base_url}/api{path}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
 
         try:
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=url,
-                headers=headers,
                 json=payload,
+                headers=headers,
+                stream=stream,
                 timeout=self.timeout,
                 verify=self.verify_tls,
             )
@@ -61,8 +113,23 @@ class GophishClient:
                 f"Gophish API error {response.status_code}: {response.text}"
             )
 
+        return response
+
+    def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Any:
+        """Send an HTTP request to the Gophish API and return JSON data."""
+
+        return self._decode(self._send(method, path, payload=payload))
+
+    @staticmethod
+    def _decode(response: requests.Response) -> Any:
+        """Parse a JSON response body."""
+
         # Some endpoints return empty bodies, so guard for that.
-        return response.json() if response.text else None
+        if not response.content:
+            return None
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
 
     def list_groups(self) -> List[GophishResource]:
         """Return all recipient groups."""
@@ -88,20 +155,59 @@ class GophishClient:
         data = self._request("GET", "/smtp/") or []
         return [GophishResource(id=item["id"], name=item["name"], raw=item) for item in data]
 
+    def list_groups_by_name(self) -> Dict[str, GophishResource]:
+        """Return all recipient groups keyed by name."""
+
+        return self._index_by_name(self.list_groups())
+
+    def list_templates_by_name(self) -> Dict[str, GophishResource]:
+        """Return all email templates keyed by name."""
+
+        return self._index_by_name(self.list_templates())
+
+    def list_pages_by_name(self) -> Dict[str, GophishResource]:
+        """Return all landing pages keyed by name."""
+
+        return self._index_by_name(self.list_pages())
+
+    def list_sending_profiles_by_name(self) -> Dict[str, GophishResource]:
+        """Return all sending profiles keyed by name."""
+
+        return self._index_by_name(self.list_sending_profiles())
+
     def list_campaigns(self) -> List[GophishResource]:
         """Return all campaigns."""
 
         data = self._request("GET", "/campaigns/") or []
         return [GophishResource(id=item["id"], name=item["name"], raw=item) for item in data]
 
-    def find_by_name(self, resources: List[GophishResource], name: str) -> GophishResource:
-        """Find a resource by name or raise a helpful error."""
+    @staticmethod
+    def _index_by_name(resources: List[GophishResource]) -> Dict[str, GophishResource]:
+        """Build a name lookup table, keeping the first resource for duplicate names."""
 
+        index: Dict[str, GophishResource] = {}
         for item in resources:
-            if item.name == name:
-                return item
-        names = ", ".join(resource.name for resource in resources) or "<none>"
-        raise GophishError(f"Resource '{name}' not found. Available: {names}")
+            index.setdefault(item.name, item)
+        return index
+
+    def find_by_name(
+        self,
+        resources: Union[List[GophishResource], Mapping[str, GophishResource]],
+        name: str,
+    ) -> GophishResource:
+        """Find a resource by name or raise a helpful error.
+
+        Accepts either a list of resources or a name-keyed mapping as returned
+        by the ``list_*_by_name`` helpers.
+        """
+
+        index = resources if isinstance(resources, Mapping) else self._index_by_name(resources)
+        try:
+            return index[name]
+        except KeyError:
+            # Only build the list of available names when the lookup misses.
+            names = ", ".join(index) or "<none>"
+            raise GophishError(f"Resource '{name}' not found. Available: {names}") from None
 
     def create_campaign(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Create a campaign in Gophish and return the response data."""
@@ -112,4 +218,59 @@ class GophishClient:
         """Fetch a campaign by ID with optional results data."""
 
         suffix = "?include_results=true" if include_results else ""
-        return self._request("GET", f"/campaigns/{campaign_id}{suffix}")
+        path = f"/campaigns/{campaign_id}{suffix}"
+
+        # Revalidate with the server's ETag/Last-Modified when we have them, so
+        # unchanged campaigns cost a 304 instead of a full download and parse.
+        headers: Dict[str, str] = {}
+        cached = self._campaign_cache.get(path)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = self._send("GET", path, headers=headers or None)
+        if response.status_code == 304 and cached:
+            return cached[2]
+
+        data = self._decode(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._campaign_cache[path] = (etag, last_modified, data)
+        else:
+            self._campaign_cache.pop(path, None)
+        return data
+
+    def get_campaign_summary(self, campaign_id: int) -> Dict[str, Any]:
+        """Fetch a campaign's name, status and stats without per-recipient results."""
+
+        return self._request("GET", f"/campaigns/{campaign_id}/summary")
+
+    def iter_campaign_results(self, campaign_id: int) -> Iterator[Dict[str, Any]]:
+        """Stream a campaign's result entries one at a time.
+
+        Gophish returns every result in a single response, which can be very
+        large for big campaigns. This parses the body incrementally so only one
+        result is held in memory at a time. Requires the optional ijson package.
+        """
+
+        if ijson is None:
+            raise GophishError("Streaming results requires the optional 'ijson' package")
+
+        response = self._send("GET", f"/campaigns/{campaign_id}?include_results=true", stream=True)
+        return self._iter_results(response)
+
+    @staticmethod
+    def _iter_results(response: requests.Response) -> Iterator[Dict[str, Any]]:
+        """Yield items of the ``results`` array from a streamed response."""
+
+        with response:
+            # Let urllib3 undo any Content-Encoding before ijson sees the bytes.
+            response.raw.decode_content = True
+            try:
+                yield from ijson.items(response.raw, "results.item", use_float=True)
+            except (ijson.JSONError, Urllib3HTTPError) as exc:
+                raise GophishError(f"Failed to read campaign results: {exc}") from exc
@@ -5,12 +5,14 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+import threading
 import time
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from config import load_config, ConfigError
 from gophish_client import GophishClient, GophishError
-from reporting import build_recipient_rows, compute_metrics, export_csv, format_report
+from reporting import compute_metrics, export_csv, format_report, iter_recipient_rows
 
 
 CONFIRM_PHRASE = "I-UNDERSTAND-THIS-IS-AWARENESS"
@@ -19,11 +21,19 @@ CONFIRM_PHRASE = "I-UNDERSTAND-THIS-IS-AWARENESS"
 def _build_campaign_payload(config, client: GophishClient) -> Dict[str, Any]:
     """Resolve resource IDs and build the Gophish campaign payload."""
 
-    group = client.find_by_name(client.list_groups(), config.campaign.group_name)
-    template = client.find_by_name(client.list_templates(), config.campaign.template_name)
-    page = client.find_by_name(client.list_pages(), config.campaign.page_name)
+    # The four lookups are independent, so fetch them concurrently to pay one
+    # round trip instead of four.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        groups = executor.submit(client.list_groups_by_name)
+        templates = executor.submit(client.list_templates_by_name)
+        pages = executor.submit(client.list_pages_by_name)
+        sending_profiles = executor.submit(client.list_sending_profiles_by_name)
+
+    group = client.find_by_name(groups.result(), config.campaign.group_name)
+    template = client.find_by_name(templates.result(), config.campaign.template_name)
+    page = client.find_by_name(pages.result(), config.campaign.page_name)
     sending_profile = client.find_by_name(
-        client.list_sending_profiles(), config.campaign.sending_profile_name
+        sending_profiles.result(), config.campaign.sending_profile_name
     )
 
     # The Gophish API expects group IDs under a list of group objects.
@@ -89,6 +99,152 @@ def _print_plan(payload: Dict[str, Any]) -> None:
     print("\n".join(plan))
 
 
+def _print_offline_plan(config) -> None:
+    """Print a dry-run plan from the config alone, without contacting Gophish.
+
+    Resource names are shown instead of IDs because they are not resolved.
+    """
+
+    plan = [
+        "Dry run plan (offline, resource names not verified):",
+        f"- Campaign name: {config.campaign.name}",
+        f"- Template: {config.campaign.template_name}",
+        f"- Page: {config.campaign.page_name}",
+        f"- Sending profile: {config.campaign.sending_profile_name}",
+        f"- Group: {config.campaign.group_name}",
+        f"- URL: {config.campaign.url}",
+    ]
+
+    if config.campaign.launch_date:
+        plan.append(f"- Launch date: {config.campaign.launch_date}")
+
+    print("\n".join(plan))
+
+
+def _stream_results(client: GophishClient, args) -> Optional[Iterator[Dict[str, Any]]]:
+    """Return a fresh result stream in --stream-results mode, else None.
+
+    Streams are single-use, so metrics and the CSV export each open their own.
+    """
+
+    if not args.stream_results:
+        return None
+    return client.iter_campaign_results(args.campaign_id)
+
+
+def _fetch_campaign(
+    client: GophishClient, args, delay: float = 0.0, stop: Optional[threading.Event] = None
+) -> Tuple[Optional[Dict[str, Any]], float]:
+    """Wait ``delay`` seconds, then fetch the campaign for the report.
+
+    Returns the campaign (None if ``stop`` was set while waiting) and how long
+    the fetch itself took, so the next poll can be scheduled to land on time.
+    """
+
+    if delay and stop is not None and stop.wait(delay):
+        return None, 0.0
+
+    started = time.monotonic()
+    if args.stream_results:
+        # Fetch the header without results; results are streamed separately.
+        campaign = client.get_campaign_summary(args.campaign_id)
+    else:
+        campaign = client.get_campaign(args.campaign_id, include_results=True)
+    return campaign, time.monotonic() - started
+
+
+def _run_report(config, args, client: GophishClient) -> int:
+    """Fetch campaign results and print metrics, optionally polling."""
+
+    if not args.campaign_id:
+        print("--campaign-id is required in report-only mode", file=sys.stderr)
+        return 1
+    # When polling is enabled, keep refreshing the report until the
+    # requested number of polls is reached (or until completed if 0).
+    poll_interval = max(args.poll_interval, 0)
+    remaining_polls = args.poll_count if poll_interval else 1
+
+    # The next poll is fetched on a worker thread while the current report is
+    # rendered, and is scheduled so it completes as the interval elapses.
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        try:
+            future = executor.submit(_fetch_campaign, client, args)
+            while True:
+                try:
+                    campaign, fetch_seconds = future.result()
+                except GophishError as exc:
+                    print(f"Failed to fetch campaign: {exc}", file=sys.stderr)
+                    return 1
+
+                # If poll_count is 0, keep polling until the campaign is completed.
+                if not poll_interval:
+                    polling = False
+                elif remaining_polls == 0:
+                    polling = campaign.get("status") != "Completed"
+                else:
+                    remaining_polls -= 1
+                    polling = remaining_polls > 0
+
+                if polling:
+                    delay = max(poll_interval - fetch_seconds, 0.0)
+                    future = executor.submit(_fetch_campaign, client, args, delay, stop)
+
+                try:
+                    metrics = compute_metrics(
+                        campaign,
+                        unique_opens_only=config.reporting.unique_opens_only,
+                        unique_clicks_only=config.reporting.unique_clicks_only,
+                        results=_stream_results(client, args),
+                    )
+                except GophishError as exc:
+                    print(f"Failed to fetch campaign: {exc}", file=sys.stderr)
+                    return 1
+
+                print(format_report(campaign, metrics))
+
+                # Export the per-recipient CSV after each refresh, overwriting the file.
+                if args.csv_out:
+                    try:
+                        rows = iter_recipient_rows(campaign, results=_stream_results(client, args))
+                        export_csv(rows, args.csv_out)
+                    except GophishError as exc:
+                        print(f"Failed to export CSV: {exc}", file=sys.stderr)
+                        return 1
+                    print(f"CSV export updated: {args.csv_out}")
+
+                if not polling:
+                    return 0
+        finally:
+            # Wake a pending poll so an early exit does not wait out the interval.
+            stop.set()
+
+
+def _run_campaign(config, args, client: GophishClient) -> int:
+    """Resolve resources, then print a dry-run plan or create the campaign."""
+
+    try:
+        payload = _build_campaign_payload(config, client)
+    except GophishError as exc:
+        print(f"Failed to resolve campaign resources: {exc}", file=sys.stderr)
+        return 1
+
+    if args.dry_run or config.dry_run:
+        _print_plan(payload)
+        return 0
+
+    try:
+        created = client.create_campaign(payload)
+    except GophishError as exc:
+        print(f"Failed to create campaign: {exc}", file=sys.stderr)
+        return 1
+
+    campaign_id = created.get("id")
+    print(f"Campaign created with ID: {campaign_id}")
+    print("Use --report-only --campaign-id to fetch click metrics.")
+    return 0
+
+
 def run() -> int:
     """Main CLI flow."""
 
@@ -105,6 +261,11 @@ def run() -> int:
         action="store_true",
         help="Validate and print the plan without sending",
     )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="With a dry run, print the plan from config without contacting Gophish",
+    )
     parser.add_argument(
         "--report-only",
         action="store_true",
@@ -131,6 +292,16 @@ def run() -> int:
         default=1,
         help="Number of polls when using --poll-interval; 0 means until completed",
     )
+    parser.add_argument(
+        "--stream-results",
+        action="store_true",
+        help="Stream campaign results instead of loading them at once (requires ijson)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk config parse cache",
+    )
     parser.add_argument(
         "--confirm",
         default="",
@@ -140,7 +311,7 @@ def run() -> int:
     args = parser.parse_args()
 
     try:
-        config = load_config(args.config)
+        config = load_config(args.config, use_cache=not args.no_cache)
     except ConfigError as exc:
         print(f"Config error: {exc}", file=sys.stderr)
         return 1
@@ -151,76 +322,22 @@ def run() -> int:
         print(f"Safety check failed: {exc}", file=sys.stderr)
         return 1
 
-    client = GophishClient(
-        base_url=config.base_url,
-        api_key=config.api_key,
-        verify_tls=config.verify_tls,
-    )
-
-    if args.report_only:
-        if not args.campaign_id:
-            print("--campaign-id is required in report-only mode", file=sys.stderr)
+    # An offline dry run needs nothing from the server, so skip the network.
+    if args.offline:
+        if args.report_only or not (args.dry_run or config.dry_run):
+            print("--offline can only be used with a dry run", file=sys.stderr)
             return 1
-        # When polling is enabled, keep refreshing the report until the
-        # requested number of polls is reached (or until completed if 0).
-        poll_interval = max(args.poll_interval, 0)
-        remaining_polls = args.poll_count if poll_interval else 1
-
-        while True:
-            try:
-                campaign = client.get_campaign(args.campaign_id, include_results=True)
-            except GophishError as exc:
-                print(f"Failed to fetch campaign: {exc}", file=sys.stderr)
-                return 1
-
-            metrics = compute_metrics(
-                campaign,
-                unique_opens_only=config.reporting.unique_opens_only,
-                unique_clicks_only=config.reporting.unique_clicks_only,
-            )
-            print(format_report(campaign, metrics))
-
-            # Export the per-recipient CSV after each refresh, overwriting the file.
-            if args.csv_out:
-                rows = build_recipient_rows(campaign)
-                export_csv(rows, args.csv_out)
-                print(f"CSV export updated: {args.csv_out}")
-
-            if not poll_interval:
-                return 0
-
-            # If poll_count is 0, keep polling until the campaign is completed.
-            if remaining_polls == 0:
-                if campaign.get("status") == "Completed":
-                    return 0
-            else:
-                remaining_polls -= 1
-                if remaining_polls <= 0:
-                    return 0
-
-            # Sleep last to ensure the first fetch happens immediately.
-            time.sleep(poll_interval)
-
-    try:
-        payload = _build_campaign_payload(config, client)
-    except GophishError as exc:
-        print(f"Failed to resolve campaign resources: {exc}", file=sys.stderr)
-        return 1
-
-    if args.dry_run or config.dry_run:
-        _print_plan(payload)
+        _print_offline_plan(config)
         return 0
 
-    try:
-        created = client.create_campaign(payload)
-    except GophishError as exc:
-        print(f"Failed to create campaign: {exc}", file=sys.stderr)
-        return 1
-
-    campaign_id = created.get("id")
-    print(f"Campaign created with ID: {campaign_id}")
-    print("Use --report-only --campaign-id to fetch click metrics.")
-    return 0
+    with GophishClient(
+        base_url=config.base_url,
+        api_key=config.api_key,
+        verify_tls=config.verify_tls,
+    ) as client:
+        if args.report_only:
+            return _run_report(config, args, client)
+        return _run_campaign(config, args, client)
 
 
 if __name__ == "__main__":
@@ -3,8 +3,39 @@
 from __future__ import annotations
 
 import csv
+import os
+import sys
+import tempfile
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Set
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+
+# Interned event type names. Incoming type strings are canonicalised through
+# _EVENT_TYPES (one hash lookup), so hot loops can compare by identity and
+# skip untracked events early.
+_OPENED = sys.intern("Opened Email")
+_CLICKED = sys.intern("Clicked Link")
+_TRACKED = frozenset({_OPENED, _CLICKED})
+_EVENT_TYPES = {event_type: event_type for event_type in _TRACKED}
+
+# Per-recipient bit flags used when counting unique opens and clicks.
+_OPENED_FLAG = 1
+_CLICKED_FLAG = 2
+
+# Column order for per-recipient CSV exports.
+CSV_FIELDNAMES = (
+    "campaign_name",
+    "campaign_status",
+    "recipient_email",
+    "recipient_status",
+    "open_count",
+    "click_count",
+    "first_open_time",
+    "first_click_time",
+    "last_event_type",
+    "last_event_time",
+)
+_CSV_BUFFER_SIZE = 1 << 16
 
 
 @dataclass
@@ -18,38 +49,68 @@ class CampaignMetrics:
     click_rate: float
 
 
-def _unique_ids(events: Iterable[Dict[str, Any]], event_type: str) -> Set[str]:
-    """Collect unique recipient IDs for a given event type."""
+def compute_metrics(
+    campaign: Dict[str, Any],
+    unique_opens_only: bool,
+    unique_clicks_only: bool,
+    results: Optional[Iterable[Dict[str, Any]]] = None,
+) -> CampaignMetrics:
+    """Compute open and click rates from the campaign payload.
 
-    return {
-        str(event.get("email"))
-        for event in events
-        if event.get("type") == event_type and event.get("email")
-    }
-
-
-def compute_metrics(campaign: Dict[str, Any], unique_opens_only: bool, unique_clicks_only: bool) -> CampaignMetrics:
-    """Compute open and click rates from the campaign payload."""
+    Events are classified in a single pass. In unique mode each recipient
+    email maps to a bitmask of opened/clicked flags, and a counter is bumped
+    only when a flag is first set; otherwise every matching event is counted.
+    Pass ``results`` to consume a stream of result entries (e.g. from
+    GophishClient.iter_campaign_results) instead of ``campaign["results"]``.
+    """
 
-    results = campaign.get("results", [])
+    if results is None:
+        results = campaign.get("results", [])
 
     # Each result entry corresponds to a recipient in the campaign.
-    total_recipients = len(results)
+    total_recipients = 0
+
+    # Local names keep the hot loop free of global lookups.
+    opened_type = _OPENED
+    clicked_type = _CLICKED
+    canonical_type = _EVENT_TYPES.get
+    # Calling dict.get unbound skips a method lookup per event.
+    get = dict.get
+    # Unique mode tracks one bitmask per recipient email instead of two sets.
+    # Counters are bumped only when a flag is first set, so no final pass.
+    seen: Dict[str, int] = {}
+    seen_flags = seen.get
+    opened_count = 0
+    clicked_count = 0
 
-    # Build event lists to support unique or raw counts.
-    all_events = []
     for result in results:
-        all_events.extend(result.get("events", []))
-
-    if unique_opens_only:
-        opened_count = len(_unique_ids(all_events, "Opened Email"))
-    else:
-        opened_count = sum(event.get("type") == "Opened Email" for event in all_events)
-
-    if unique_clicks_only:
-        clicked_count = len(_unique_ids(all_events, "Clicked Link"))
-    else:
-        clicked_count = sum(event.get("type") == "Clicked Link" for event in all_events)
+        total_recipients += 1
+        for event in get(result, "events", []):
+            event_type = canonical_type(get(event, "type"))
+            if event_type is None:
+                continue
+            if event_type is opened_type:
+                if unique_opens_only:
+                    email = get(event, "email")
+                    if email:
+                        email = str(email)
+                        flags = seen_flags(email, 0)
+                        if not flags & _OPENED_FLAG:
+                            seen[email] = flags | _OPENED_FLAG
+                            opened_count += 1
+                else:
+                    opened_count += 1
+            elif event_type is clicked_type:
+                if unique_clicks_only:
+                    email = get(event, "email")
+                    if email:
+                        email = str(email)
+                        flags = seen_flags(email, 0)
+                        if not flags & _CLICKED_FLAG:
+                            seen[email] = flags | _CLICKED_FLAG
+                            clicked_count += 1
+                else:
+                    clicked_count += 1
 
     open_rate = (opened_count / total_recipients) * 100 if total_recipients else 0.0
     click_rate = (clicked_count / total_recipients) * 100 if total_recipients else 0.0
@@ -80,79 +141,100 @@ def format_report(campaign: Dict[str, Any], metrics: CampaignMetrics) -> str:
     return "\n".join(report_lines)
 
 
-def _extract_event_times(events: Iterable[Dict[str, Any]], event_type: str) -> List[str]:
-    """Return a list of event timestamps for a specific event type.
+def _summarize_events(events: Iterable[Dict[str, Any]]) -> Tuple[int, str, int, str, Dict[str, Any]]:
+    """Summarize a recipient's events in a single pass.
 
-    Gophish events include a time value as a string. We do not parse it so that
-    we avoid timezone assumptions and keep reporting faithful to the API.
+    Returns the open count, first open time, click count, first click time and
+    the last event. Only timestamped opens and clicks are counted. Gophish
+    event times are kept as strings so we avoid timezone assumptions and keep
+    reporting faithful to the API.
     """
 
-    return [
-        str(event.get("time"))
-        for event in events
-        if event.get("type") == event_type and event.get("time")
-    ]
-
-
-def build_recipient_rows(campaign: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Build per-recipient rows for CSV export.
-
-    Each row includes recipient status plus basic engagement counts. This keeps
-    the CSV easy to analyze in spreadsheets without exposing extra metadata.
+    opened_type = _OPENED
+    clicked_type = _CLICKED
+    canonical_type = _EVENT_TYPES.get
+    get = dict.get
+    open_count = click_count = 0
+    first_open = first_click = ""
+    last_event: Dict[str, Any] = {}
+
+    for event in events:
+        last_event = event
+        event_type = canonical_type(get(event, "type"))
+        if event_type is None:
+            continue
+        event_time = get(event, "time")
+        if not event_time:
+            continue
+        if event_type is opened_type:
+            if not open_count:
+                first_open = str(event_time)
+            open_count += 1
+        elif event_type is clicked_type:
+            if not click_count:
+                first_click = str(event_time)
+            click_count += 1
+
+    return open_count, first_open, click_count, first_click, last_event
+
+
+def iter_recipient_rows(
+    campaign: Dict[str, Any],
+    results: Optional[Iterable[Dict[str, Any]]] = None,
+) -> Iterator[Tuple[Any, ...]]:
+    """Yield per-recipient rows for CSV export.
+
+    Each row includes recipient status plus basic engagement counts, in the
+    column order of CSV_FIELDNAMES. Rows are produced lazily so large campaigns
+    can be written without holding every row in memory. As with
+    compute_metrics, ``results`` may be a stream of result entries.
     """
 
     campaign_name = campaign.get("name", "<unknown>")
     campaign_status = campaign.get("status", "<unknown>")
 
-    rows = []
-    for result in campaign.get("results", []):
-        events = result.get("events", [])
-        opened_times = _extract_event_times(events, "Opened Email")
-        clicked_times = _extract_event_times(events, "Clicked Link")
+    if results is None:
+        results = campaign.get("results", [])
 
+    for result in results:
         # Use the first/last event timestamps as light-weight activity markers.
-        first_open = opened_times[0] if opened_times else ""
-        first_click = clicked_times[0] if clicked_times else ""
-        last_event = events[-1] if events else {}
-
-        rows.append(
-            {
-                "campaign_name": campaign_name,
-                "campaign_status": campaign_status,
-                "recipient_email": result.get("email", ""),
-                "recipient_status": result.get("status", ""),
-                "open_count": len(opened_times),
-                "click_count": len(clicked_times),
-                "first_open_time": first_open,
-                "first_click_time": first_click,
-                "last_event_type": last_event.get("type", ""),
-                "last_event_time": last_event.get("time", ""),
-            }
+        open_count, first_open, click_count, first_click, last_event = _summarize_events(
+            result.get("events", [])
         )
 
-    return rows
+        yield (
+            campaign_name,
+            campaign_status,
+            result.get("email", ""),
+            result.get("status", ""),
+            open_count,
+            click_count,
+            first_open,
+            first_click,
+            last_event.get("type", ""),
+            last_event.get("time", ""),
+        )
 
 
-def export_csv(rows: List[Dict[str, Any]], output_path: str) -> None:
+def export_csv(rows: Iterable[Sequence[Any]], output_path: str) -> None:
     """Write CSV rows to the requested file path.
 
     The CSV uses a fixed column order so repeated exports remain consistent.
+    Rows are consumed as they are written, so a generator is never buffered.
+    The file is written to a temp file and renamed into place, so a stream that
+    fails partway leaves the previous export intact.
     """
 
-    fieldnames = [
-        "campaign_name",
-        "campaign_status",
-        "recipient_email",
-        "recipient_status",
-        "open_count",
-        "click_count",
-        "first_open_time",
-        "first_click_time",
-        "last_event_type",
-        "last_event_time",
-    ]
-
-    with open(output_path, "w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(output_path)), suffix=".tmp"
+    )
+    try:
+        # A larger buffer means fewer write syscalls for big recipient sets.
+        with open(fd, "w", encoding="utf-8", newline="", buffering=_CSV_BUFFER_SIZE) as handle:
+            writer = csv.writer(handle)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(rows)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise